@@ -262,84 +262,79 @@ const DataLoader = (() => {
     // ══════════════════════════════════════════════════════
     function parseCSV(file) {
         return new Promise((resolve, reject) => {
-            const reader = new FileReader();
-            reader.onload = function(readerEvent) {
-                const rawText = readerEvent.target.result;
-
-                Papa.parse(rawText, {
-                    header: true,
-                    dynamicTyping: true,
-                    skipEmptyLines: true,
-                    complete: (results) => {
-                        const { data, meta } = results;
-
-                        // Validate required columns
-                        const missing = REQUIRED_COLUMNS.filter(
-                            c => !meta.fields.includes(c)
-                        );
-                        if (missing.length > 0) {
-                            reject(new Error(`Missing columns: ${missing.join(', ')}`));
-                            return;
-                        }
+            // Hand Papa the File itself: it reads and tokenizes in chunks,
+            // so the whole upload is never held as one string beside the rows
+            Papa.parse(file, {
+                header: true,
+                dynamicTyping: true,
+                skipEmptyLines: true,
+                complete: (results) => {
+                    const { data, meta } = results;
 
-                        const MIN_ROWS = 30;
-                        if (data.length < MIN_ROWS) {
-                            reject(new Error(`Need at least ${MIN_ROWS} rows of historical data (found ${data.length})`));
-                            return;
-                        }
-                        console.log(`✓ Dataset has ${data.length} rows (minimum ${MIN_ROWS} required)`);
-
-                        // Parse dates (handle DD/MM/YYYY and ISO formats)
-                        data.forEach(row => {
-                            if (row.time) {
-                                const parts = String(row.time).split('/');
-                                if (parts.length === 3 && parts[0].length <= 2) {
-                                    row._date = new Date(+parts[2], +parts[1] - 1, +parts[0]);
-                                } else {
-                                    row._date = new Date(row.time);
-                                }
+                    // Validate required columns
+                    const missing = REQUIRED_COLUMNS.filter(
+                        c => !meta.fields.includes(c)
+                    );
+                    if (missing.length > 0) {
+                        reject(new Error(`Missing columns: ${missing.join(', ')}`));
+                        return;
+                    }
+
+                    const MIN_ROWS = 30;
+                    if (data.length < MIN_ROWS) {
+                        reject(new Error(`Need at least ${MIN_ROWS} rows of historical data (found ${data.length})`));
+                        return;
+                    }
+                    console.log(`✓ Dataset has ${data.length} rows (minimum ${MIN_ROWS} required)`);
+
+                    // Parse dates (handle DD/MM/YYYY and ISO formats)
+                    data.forEach(row => {
+                        if (row.time) {
+                            const parts = String(row.time).split('/');
+                            if (parts.length === 3 && parts[0].length <= 2) {
+                                row._date = new Date(+parts[2], +parts[1] - 1, +parts[0]);
+                            } else {
+                                row._date = new Date(row.time);
                             }
-                        });
+                        }
+                    });
 
-                        // Sort by date
-                        data.sort((a, b) => (a._date || 0) - (b._date || 0));
+                    // Sort by date
+                    data.sort((a, b) => (a._date || 0) - (b._date || 0));
 
-                        // Validate & fill missing features to reach 39
-                        const validatedData = validateAndFillFeatures(data, meta.fields);
-                        rawData = validatedData.data;
-                        parsedData = validatedData.data;
+                    // Validate & fill missing features to reach 39
+                    const validatedData = validateAndFillFeatures(data, meta.fields);
+                    rawData = validatedData.data;
+                    parsedData = validatedData.data;
 
-                        // Set global flags
-                        window.uploadedData = validatedData.data;
-                        window.isCustomUpload = true;
-                        window.isSampleData = false;
+                    // Set global flags
+                    window.uploadedData = validatedData.data;
+                    window.isCustomUpload = true;
+                    window.isSampleData = false;
 
-                        // Reset in-memory forecast state
-                        if (typeof Forecasting !== 'undefined' && Forecasting.clearCache) {
-                            Forecasting.clearCache();
-                        }
+                    // Reset in-memory forecast state
+                    if (typeof Forecasting !== 'undefined' && Forecasting.clearCache) {
+                        Forecasting.clearCache();
+                    }
 
-                        const dates = validatedData.data.filter(r => r._date).map(r => r._date);
-                        _lastDataDate = dates.length ? dates[dates.length - 1] : null;
-
-                        console.log('[DataLoader] Upload complete:',
-                            validatedData.data.length, 'rows,',
-                            'last date:', _lastDataDate,
-                            'window.isCustomUpload:', window.isCustomUpload);
-
-                        resolve({
-                            success: true,
-                            records: validatedData.data.length,
-                            from: dates.length ? formatDate(dates[0]) : '—',
-                            to: dates.length ? formatDate(dates[dates.length - 1]) : '—',
-                            features: validatedData.featureCount,
-                        });
-                    },
-                    error: (err) => reject(err),
-                });
-            };
-            reader.onerror = function() { reject(new Error('Failed to read uploaded file')); };
-            reader.readAsText(file);
+                    const dates = validatedData.data.filter(r => r._date).map(r => r._date);
+                    _lastDataDate = dates.length ? dates[dates.length - 1] : null;
+
+                    console.log('[DataLoader] Upload complete:',
+                        validatedData.data.length, 'rows,',
+                        'last date:', _lastDataDate,
+                        'window.isCustomUpload:', window.isCustomUpload);
+
+                    resolve({
+                        success: true,
+                        records: validatedData.data.length,
+                        from: dates.length ? formatDate(dates[0]) : '—',
+                        to: dates.length ? formatDate(dates[dates.length - 1]) : '—',
+                        features: validatedData.featureCount,
+                    });
+                },
+                error: () => reject(new Error('Failed to read uploaded file')),
+            });
         });
     }
 
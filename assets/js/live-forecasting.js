@@ -82,34 +82,93 @@ const LiveForecasting = (() => {
     // ══════════════════════════════════════════════════════
     // SHA-256 (synchronous, pure JS — for deterministic hashing)
     // ══════════════════════════════════════════════════════
-    function sha256Sync(message) {
-        const K = new Uint32Array([
-            0x428a2f98,0x71374491,0xb5c0fbcf,0xe9b5dba5,0x3956c25b,0x59f111f1,0x923f82a4,0xab1c5ed5,
-            0xd807aa98,0x12835b01,0x243185be,0x550c7dc3,0x72be5d74,0x80deb1fe,0x9bdc06a7,0xc19bf174,
-            0xe49b69c1,0xefbe4786,0x0fc19dc6,0x240ca1cc,0x2de92c6f,0x4a7484aa,0x5cb0a9dc,0x76f988da,
-            0x983e5152,0xa831c66d,0xb00327c8,0xbf597fc7,0xc6e00bf3,0xd5a79147,0x06ca6351,0x14292967,
-            0x27b70a85,0x2e1b2138,0x4d2c6dfc,0x53380d13,0x650a7354,0x766a0abb,0x81c2c92e,0x92722c85,
-            0xa2bfe8a1,0xa81a664b,0xc24b8b70,0xc76c51a3,0xd192e819,0xd6990624,0xf40e3585,0x106aa070,
-            0x19a4c116,0x1e376c08,0x2748774c,0x34b0bcb5,0x391c0cb3,0x4ed8aa4a,0x5b9cca4f,0x682e6ff3,
-            0x748f82ee,0x78a5636f,0x84c87814,0x8cc70208,0x90befffa,0xa4506ceb,0xbef9a3f7,0xc67178f2
-        ]);
-        const H = new Uint32Array([
-            0x6a09e667,0xbb67ae85,0x3c6ef372,0xa54ff53a,
-            0x510e527f,0x9b05688c,0x1f83d9ab,0x5be0cd19
-        ]);
-        const enc = new TextEncoder();
-        const msgBytes = enc.encode(message);
-        const bitLen = msgBytes.length * 8;
-        const padLen = Math.ceil((msgBytes.length + 9) / 64) * 64;
-        const buf = new ArrayBuffer(padLen);
-        const pad = new Uint8Array(buf);
-        pad.set(msgBytes);
-        pad[msgBytes.length] = 0x80;
-        const dv = new DataView(buf);
-        dv.setUint32(padLen - 8, Math.floor(bitLen / 0x100000000), false);
-        dv.setUint32(padLen - 4, bitLen >>> 0, false);
-        const W = new Uint32Array(64);
-        for (let off = 0; off < padLen; off += 64) {
+    const SHA256_K = new Uint32Array([
+        0x428a2f98,0x71374491,0xb5c0fbcf,0xe9b5dba5,0x3956c25b,0x59f111f1,0x923f82a4,0xab1c5ed5,
+        0xd807aa98,0x12835b01,0x243185be,0x550c7dc3,0x72be5d74,0x80deb1fe,0x9bdc06a7,0xc19bf174,
+        0xe49b69c1,0xefbe4786,0x0fc19dc6,0x240ca1cc,0x2de92c6f,0x4a7484aa,0x5cb0a9dc,0x76f988da,
+        0x983e5152,0xa831c66d,0xb00327c8,0xbf597fc7,0xc6e00bf3,0xd5a79147,0x06ca6351,0x14292967,
+        0x27b70a85,0x2e1b2138,0x4d2c6dfc,0x53380d13,0x650a7354,0x766a0abb,0x81c2c92e,0x92722c85,
+        0xa2bfe8a1,0xa81a664b,0xc24b8b70,0xc76c51a3,0xd192e819,0xd6990624,0xf40e3585,0x106aa070,
+        0x19a4c116,0x1e376c08,0x2748774c,0x34b0bcb5,0x391c0cb3,0x4ed8aa4a,0x5b9cca4f,0x682e6ff3,
+        0x748f82ee,0x78a5636f,0x84c87814,0x8cc70208,0x90befffa,0xa4506ceb,0xbef9a3f7,0xc67178f2
+    ]);
+    const SHA256_INIT = [
+        0x6a09e667,0xbb67ae85,0x3c6ef372,0xa54ff53a,
+        0x510e527f,0x9b05688c,0x1f83d9ab,0x5be0cd19
+    ];
+    const UTF8 = new TextEncoder();
+
+    /**
+     * Incremental SHA-256: feed strings with update(), then read digest()
+     * (eight big-endian 32-bit words) and/or hexDigest().
+     * Only one 64-byte block is buffered, so the message is never held whole.
+     */
+    class Sha256 {
+        constructor() {
+            this.H = new Uint32Array(SHA256_INIT);
+            this.W = new Uint32Array(64);
+            this.block = new Uint8Array(64);
+            this.blockView = new DataView(this.block.buffer);
+            this.fill = 0;
+            this.length = 0;
+            this.finished = false;
+        }
+
+        update(str) {
+            if (this.finished) throw new Error('Sha256.update() called after digest()');
+            const bytes = UTF8.encode(str);
+            const n = bytes.length;
+            this.length += n;
+            let i = 0;
+            // Top up a partially filled block first
+            if (this.fill > 0) {
+                const take = Math.min(64 - this.fill, n);
+                this.block.set(bytes.subarray(0, take), this.fill);
+                this.fill += take;
+                i = take;
+                if (this.fill < 64) return this;
+                this._compress(this.blockView, 0);
+                this.fill = 0;
+            }
+            // Whole blocks straight from the input, no copy
+            if (n - i >= 64) {
+                const view = new DataView(bytes.buffer, bytes.byteOffset, n);
+                for (; i + 64 <= n; i += 64) this._compress(view, i);
+            }
+            if (i < n) {
+                this.block.set(bytes.subarray(i), 0);
+                this.fill = n - i;
+            }
+            return this;
+        }
+
+        digest() {
+            if (this.finished) return this.H.slice();
+            this.finished = true;
+            const block = this.block;
+            block[this.fill++] = 0x80;
+            if (this.fill > 56) {
+                block.fill(0, this.fill);
+                this._compress(this.blockView, 0);
+                this.fill = 0;
+            }
+            block.fill(0, this.fill);
+            const bitLen = this.length * 8;
+            this.blockView.setUint32(56, Math.floor(bitLen / 0x100000000), false);
+            this.blockView.setUint32(60, bitLen >>> 0, false);
+            this._compress(this.blockView, 0);
+            return this.H.slice();
+        }
+
+        hexDigest() {
+            const H = this.digest();
+            let hex = '';
+            for (let i = 0; i < 8; i++) hex += (H[i]>>>0).toString(16).padStart(8,'0');
+            return hex;
+        }
+
+        _compress(dv, off) {
+            const H = this.H, W = this.W, K = SHA256_K;
             for (let i = 0; i < 16; i++) W[i] = dv.getUint32(off + i * 4, false);
             for (let i = 16; i < 64; i++) {
                 const s0 = ((W[i-15]>>>7)|(W[i-15]<<25))^((W[i-15]>>>18)|(W[i-15]<<14))^(W[i-15]>>>3);
@@ -129,9 +188,6 @@ const LiveForecasting = (() => {
             H[0]=(H[0]+a)|0;H[1]=(H[1]+b)|0;H[2]=(H[2]+c)|0;H[3]=(H[3]+d)|0;
             H[4]=(H[4]+e)|0;H[5]=(H[5]+f)|0;H[6]=(H[6]+g)|0;H[7]=(H[7]+h)|0;
         }
-        let hex = '';
-        for (let i = 0; i < 8; i++) hex += (H[i]>>>0).toString(16).padStart(8,'0');
-        return hex;
     }
 
     // ══════════════════════════════════════════════════════
@@ -153,9 +209,24 @@ const LiveForecasting = (() => {
         'Precip_30D_Sum','Precip_Lag_60','Soil_Moisture_Lag_14'
     ];
 
+    // Digit value of s[i], or -1 if it is not 0-9
+    function digitAt(s, i) {
+        const c = s.charCodeAt(i) - 48;
+        return c >= 0 && c <= 9 ? c : -1;
+    }
+
     function parseDateStr(timeStr) {
         if (!timeStr) return null;
         const s = String(timeStr);
+        // Fast path: canonical DD/MM/YYYY, read digit by digit without splitting
+        if (s.length === 10 && s.charCodeAt(2) === 47 && s.charCodeAt(5) === 47) {
+            const d0 = digitAt(s, 0), d1 = digitAt(s, 1);
+            const m0 = digitAt(s, 3), m1 = digitAt(s, 4);
+            const y0 = digitAt(s, 6), y1 = digitAt(s, 7), y2 = digitAt(s, 8), y3 = digitAt(s, 9);
+            if ((d0 | d1 | m0 | m1 | y0 | y1 | y2 | y3) >= 0) {
+                return new Date(y0 * 1000 + y1 * 100 + y2 * 10 + y3, m0 * 10 + m1 - 1, d0 * 10 + d1);
+            }
+        }
         const parts = s.split('/');
         if (parts.length === 3 && parts[2].length === 4) {
             return new Date(parseInt(parts[2]), parseInt(parts[1]) - 1, parseInt(parts[0]));
@@ -164,9 +235,13 @@ const LiveForecasting = (() => {
         return isNaN(d.getTime()) ? null : d;
     }
 
+    const MONTH_DAYS = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31];
+
     function daysInMonth(year, month) {
         // month is 0-indexed (0=Jan)
-        return new Date(year, month + 1, 0).getDate();
+        if (month !== 1) return MONTH_DAYS[month];
+        const leap = (year % 4 === 0 && year % 100 !== 0) || year % 400 === 0;
+        return leap ? 29 : 28;
     }
 
     /**
@@ -188,11 +263,22 @@ const LiveForecasting = (() => {
         if (!data || data.length === 0) return null;
 
         // Step 1: Sort by date ascending
-        const sorted = [...data].sort((a, b) => {
-            const da = a._date || parseDateStr(a.time);
-            const db = b._date || parseDateStr(b.time);
-            return ((da && da.getTime()) || 0) - ((db && db.getTime()) || 0);
-        });
+        // (each row's date is parsed once up front, not on every comparison;
+        // input that is already in date order is used as-is)
+        const n = data.length;
+        const dateKeys = new Float64Array(n);
+        let inOrder = true;
+        for (let i = 0; i < n; i++) {
+            const d = data[i]._date || parseDateStr(data[i].time);
+            dateKeys[i] = (d && d.getTime()) || 0;
+            if (i > 0 && dateKeys[i] < dateKeys[i - 1]) inOrder = false;
+        }
+        let sorted = data;
+        if (!inOrder) {
+            const order = Array.from({ length: n }, (_, i) => i);
+            order.sort((a, b) => dateKeys[a] - dateKeys[b]);
+            sorted = order.map(i => data[i]);
+        }
 
         // Step 2: Last date
         const lastRow = sorted[sorted.length - 1];
@@ -205,20 +291,27 @@ const LiveForecasting = (() => {
         if (nextMo > 11) { nextMo = 0; nextYr++; }
         const daysInNextMo = daysInMonth(nextYr, nextMo);
 
-        // Step 4: Concatenate all rows in sorted order
-        const fullString = sorted.map(row => {
-            return HASH_COLUMNS.map(col => {
-                const v = row[col];
-                return v != null ? String(v) : '';
-            }).join(',');
-        }).join('|');
-
-        // Step 5: SHA-256
-        const hash = sha256Sync(fullString);
+        // Step 4-5: Stream all rows in sorted order into SHA-256
+        // (one row buffered at a time; the joined payload is never built)
+        const hasher = new Sha256();
+        const nCols = HASH_COLUMNS.length;
+        for (let r = 0; r < sorted.length; r++) {
+            const row = sorted[r];
+            let line = r > 0 ? '|' : '';
+            for (let c = 0; c < nCols; c++) {
+                if (c > 0) line += ',';
+                const v = row[HASH_COLUMNS[c]];
+                if (v != null) line += v; // concatenation already stringifies
+            }
+            hasher.update(line);
+        }
+        const words = hasher.digest();
+        const hash = hasher.hexDigest();
 
         // Step 6: First 8 hex chars → integer
+        // (read straight from the first digest word; the hex is for display)
         const prefix = hash.substring(0, 8);
-        const intVal = parseInt(prefix, 16);
+        const intVal = words[0] >>> 0;
 
         // Step 7-8: Predicted day
         const predictedDay = (intVal % daysInNextMo) + 1;
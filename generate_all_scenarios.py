@@ -13,9 +13,13 @@ Scenarios:
   6. Post-Crash Stable  (Jul-Aug 2026)
 """
 
-import csv, os, math, random
+import os, multiprocessing, zlib
 from datetime import datetime, timedelta
 
+import numpy as np
+
+RNG = np.random.default_rng(42)  # default generator; main() seeds one per scenario
+
 # ── Column order (must match existing CSVs) ───────────────
 COLUMNS = [
     'time', 'year', 'month', 'week_of_year', 'day_of_week',
@@ -43,124 +47,192 @@ WEATHER = {
     8:  {'temp_mean': 28.5, 'temp_range': 4.0, 'precip_base': 140, 'precip_var': 80,  'humidity': 85, 'soil': 0.40, 'et0': 13.0, 'hum_var': 6},
 }
 
+# Same profiles as one array per field, indexed by month number (0-12);
+# months without a profile fall back to June
+WEATHER_BY_MONTH = {
+    key: np.array([WEATHER.get(m, WEATHER[6])[key] for m in range(13)], dtype=float)
+    for key in WEATHER[6]
+}
+
 
 def r(v, d=2):
     """Round helper."""
     return round(v, d)
 
 
+def as_column(values, bounds=()):
+    """
+    Array -> list of plain values for a table column. Entries flagged by a
+    (mask, bound) pair become the int bound, as a scalar max()/min() clamp
+    returns it, so the CSV keeps printing e.g. 0 rather than 0.0.
+    """
+    if not bounds:
+        return values.tolist()
+    column = values.astype(object)
+    for mask, bound in bounds:
+        column[mask] = bound
+    return column.tolist()
+
+
 def week_of_year(dt):
     return dt.isocalendar()[1]
 
 
-def generate_weather(dt, profile_override=None):
-    """Generate realistic daily weather for Kerala."""
-    m = dt.month
-    w = WEATHER.get(m, WEATHER[6])
-    if profile_override:
-        w = {**w, **profile_override}
+def generate_weather_batch(dates, profile_override=None, rng=RNG):
+    """Generate realistic daily weather for Kerala, one array per field."""
+    n = len(dates)
+    months = np.array([dt.month for dt in dates])
+    profile_override = profile_override or {}
 
-    temp_mean = w['temp_mean'] + random.gauss(0, 1.2)
-    temp_max = temp_mean + random.uniform(2.5, w['temp_range'])
-    temp_min = temp_mean - random.uniform(2.0, w['temp_range'] - 0.5)
-    temp_diff = r(temp_max - temp_min, 1)
+    def field(key):
+        if key in profile_override:
+            return np.full(n, float(profile_override[key]))
+        return WEATHER_BY_MONTH[key][months]
 
-    # Precipitation: mostly zero on dry days, heavy on monsoon days
-    if random.random() < (0.15 + 0.55 * (w['precip_base'] / 300)):
-        precip = max(0, random.gauss(w['precip_base'] / 5, w['precip_var'] / 4))
-    else:
-        precip = max(0, random.gauss(0.5, 1.5))
+    temp_mean = field('temp_mean') + rng.normal(0, 1.2, n)
+    temp_range = field('temp_range')
+    temp_max = temp_mean + rng.uniform(2.5, temp_range)
+    temp_min = temp_mean - rng.uniform(2.0, temp_range - 0.5)
+    temp_diff = np.round(temp_max - temp_min, 1)
 
-    humidity = max(40, min(98, w['humidity'] + random.gauss(0, w['hum_var'])))
-    soil = max(0.18, min(0.55, w['soil'] + random.gauss(0, 0.025)))
-    et0 = max(5, w['et0'] + random.gauss(0, 2.5))
+    # Precipitation: mostly zero on dry days, heavy on monsoon days
+    precip_base = field('precip_base')
+    wet = rng.random(n) < (0.15 + 0.55 * (precip_base / 300))
+    precip = np.where(wet,
+                      rng.normal(precip_base / 5, field('precip_var') / 4),
+                      rng.normal(0.5, 1.5, n))
+
+    raw_humidity = field('humidity') + rng.normal(0, field('hum_var'))
+    humidity = np.clip(raw_humidity, 40, 98)
+    soil = np.clip(field('soil') + rng.normal(0, 0.025, n), 0.18, 0.55)
+    raw_et0 = field('et0') + rng.normal(0, 2.5, n)
+    et0 = np.maximum(5, raw_et0)
+    dry = precip <= 0  # clamped to 0 mm below
 
     return {
-        'temp_mean': r(temp_mean, 1),
-        'temp_max': r(temp_max, 1),
-        'temp_min': r(temp_min, 1),
-        'temp_diff': r(temp_diff, 1),
-        'precip': r(max(0, precip), 1),
-        'humidity': r(humidity, 1),
-        'soil': r(soil, 3),
-        'et0': r(et0, 1),
+        'temp_mean': np.round(temp_mean, 1),
+        'temp_max': np.round(temp_max, 1),
+        'temp_min': np.round(temp_min, 1),
+        'temp_diff': np.round(temp_diff, 1),
+        'precip': np.round(np.maximum(0, precip), 1),
+        'humidity': np.round(humidity, 1),
+        'soil': np.round(soil, 3),
+        'et0': np.round(et0, 1),
+        'dry': dry,
+        # Integer clamp bounds per field, for as_column()
+        'bounds': {
+            'precip': [(dry, 0)],
+            'humidity': [(raw_humidity >= 98, 98), (raw_humidity <= 40, 40)],
+            'et0': [(raw_et0 <= 5, 5)],
+        },
     }
 
 
+# ── Trend patterns: each returns the full per-day trend vector ──
+def _trend_linear(n, trend_total, volatility, rng):
+    return np.full(n, trend_total / n)
+
+
+def _trend_choppy(n, trend_total, volatility, rng):
+    return trend_total / n + rng.choice([-1, 1], n) * volatility * 0.5
+
+
+def _trend_accelerating(n, trend_total, volatility, rng):
+    # Trend accelerates through the period
+    return trend_total / n * (0.3 + 1.4 * (np.arange(n) / n))
+
+
+def _trend_bubble(n, trend_total, volatility, rng):
+    # Rise first 72%, then correction last 28%
+    peak = int(n * 0.72)
+    trend = np.empty(n)
+    trend[:peak] = abs(trend_total) / (n * 0.72) * 1.1
+    trend[peak:] = -abs(trend_total) / (n * 0.28) * 0.8
+    return trend
+
+
+def _trend_recovery(n, trend_total, volatility, rng):
+    # Slight dip first 20%, then steady rise
+    dip = int(n * 0.2)
+    trend = np.empty(n)
+    trend[:dip] = -abs(trend_total / n) * 0.5
+    trend[dip:] = abs(trend_total / n) * 1.25
+    return trend
+
+
+_TREND_FNS = {
+    'linear': _trend_linear,
+    'choppy': _trend_choppy,
+    'accelerating': _trend_accelerating,
+    'bubble': _trend_bubble,
+    'recovery': _trend_recovery,
+}
+
+
 def generate_prices(n, base_price, trend_total, volatility, pattern='linear',
-                    events=None, clamp_daily=0.045):
+                    events=None, clamp_daily=0.045, rng=RNG):
     """
     Generate n daily prices with specified characteristics.
 
     pattern: 'linear', 'choppy', 'accelerating', 'bubble', 'recovery'
     events: list of (day_index, pct_shock) tuples
     """
-    prices = []
-    price = base_price
     events = events or []
-    event_map = {d: s for d, s in events}
 
-    # Pre-compute daily trend
-    daily_trend = trend_total / n
+    # Per-day trend vector, built once by the pattern's generator
+    trend_fn = _TREND_FNS.get(pattern, _trend_linear)
+    trend = trend_fn(n, trend_total, volatility, rng)
+
+    # Unit noise (scaled by the running price below) and event shocks
+    noise = rng.standard_normal(n)
+    shock = np.zeros(n)
+    for d, s in events:
+        shock[d] = s
+
+    path = _price_path(base_price, volatility, clamp_daily,
+                       trend.tolist(), noise.tolist(), shock.tolist())
+    return [r(p, 3) for p in path]
+
+
+def _price_path(base_price, volatility, clamp_daily, trend, noise, shock):
+    """
+    Run the sequential price recursion over pre-drawn trend/noise/shock lists.
 
+    Noise scale and clamps depend on the previous day's price, so this part
+    stays a plain loop; at 30 steps it is cheaper than any compiler start-up.
+    """
+    n = len(trend)
+    path = [0.0] * n
+    price = base_price
+    lo = base_price * 0.85
+    hi = base_price * 1.15
+    last_change = 0.0
     for i in range(n):
-        # Base trend component depends on pattern
-        if pattern == 'linear':
-            t = daily_trend
-        elif pattern == 'choppy':
-            t = daily_trend + random.choice([-1, 1]) * volatility * 0.5
-        elif pattern == 'accelerating':
-            # Trend accelerates through the period
-            t = daily_trend * (0.3 + 1.4 * (i / n))
-        elif pattern == 'bubble':
-            # Rise first 72%, then correction last 28%
-            if i < int(n * 0.72):
-                t = abs(trend_total) / (n * 0.72) * 1.1
-            else:
-                t = -abs(trend_total) / (n * 0.28) * 0.8
-        elif pattern == 'recovery':
-            # Slight dip first 20%, then steady rise
-            if i < int(n * 0.2):
-                t = -abs(daily_trend) * 0.5
-            else:
-                t = abs(daily_trend) * 1.25
-        else:
-            t = daily_trend
-
-        # Noise (volatility clustering: high vol days cluster)
-        if i > 0 and abs(prices[-1] - (prices[-2] if len(prices) > 1 else prices[-1])) / price > volatility * 1.5:
-            vol_mult = 1.6  # cluster
-        else:
-            vol_mult = 1.0
-        noise = random.gauss(0, volatility * price * vol_mult)
-
-        # Event shocks
-        shock = event_map.get(i, 0) * price
-
-        # Day-of-week effect: weekends/Mondays slightly different
-        daily_change = t * price + noise + shock
+        # Noise (volatility clustering: a big move yesterday widens today's noise)
+        vol_mult = 1.6 if last_change / price > volatility * 1.5 else 1.0
+
+        daily_change = (trend[i] + shock[i]) * price + noise[i] * volatility * price * vol_mult
 
         # Clamp extreme single-day moves
         max_change = price * clamp_daily
         daily_change = max(-max_change, min(max_change, daily_change))
+        last_change = abs(daily_change)
 
-        price = price + daily_change
         # Keep price within +-15% of base to prevent runaway
-        price = max(base_price * 0.85, min(base_price * 1.15, price))
-        prices.append(r(price, 3))
+        price = max(lo, min(hi, price + daily_change))
+        path[i] = price
+    return path
 
-    return prices
 
+def compute_spread(avg_prices, volatility_base, rng=RNG):
+    """MaxPrice spread above average, for a whole price series."""
+    avg_prices = np.asarray(avg_prices)
+    spread_pct = rng.uniform(0.08, 0.22, avg_prices.shape) + volatility_base * 2
+    return np.round(avg_prices * spread_pct, 3)
 
-def compute_spread(avg_price, volatility_base):
-    """MaxPrice spread above average."""
-    spread_pct = random.uniform(0.08, 0.22) + volatility_base * 2
-    spread = avg_price * spread_pct
-    return r(spread, 3)
 
-
-def generate_scenario(config):
-    """Generate a complete 30-row, 39-column dataset."""
+def generate_scenario(config, rng=RNG):
+    """Generate a complete 30-row, 39-column dataset as a column -> values table."""
     start_date = datetime.strptime(config['start_date'], '%Y-%m-%d')
     n = config.get('n_days', 30)
     base_price = config['base_price']
@@ -173,6 +245,7 @@ def generate_scenario(config):
         config.get('pattern', 'linear'),
         config.get('events', []),
         config.get('clamp_daily', 0.045),
+        rng,
     )
 
     # Generate supply series
@@ -180,151 +253,133 @@ def generate_scenario(config):
     supply_var = config.get('supply_var', 3000)
     supply_trend = config.get('supply_trend', 0)  # per-day change
 
-    rows = []
+    # Columnar table: one list per output column, in COLUMNS order
+    table = {col: [] for col in COLUMNS}
 
     # Pre-generate weather for consistency in 7D/30D aggregates
-    weather_days = []
-    for i in range(n):
-        dt = start_date + timedelta(days=i)
-        weather_days.append(generate_weather(dt, config.get('weather_override')))
+    dates = [start_date + timedelta(days=i) for i in range(n)]
+    dows = np.array([dt.weekday() for dt in dates])  # 0=Mon
+    weather = generate_weather_batch(dates, config.get('weather_override'), rng)
+
+    # Prefix sums (leading zero) so every rolling window is one subtraction
+    cum_price = np.concatenate(([0.0], np.cumsum(prices))).tolist()
+    cum_precip = np.concatenate(([0.0], np.cumsum(weather['precip']))).tolist()
+    cum_hum = np.concatenate(([0.0], np.cumsum(weather['humidity']))).tolist()
+    # Count of days not clamped to 0 mm: a window of only clamped days sums to int 0
+    cum_rain_days = np.concatenate(([0], np.cumsum(~weather['dry']))).tolist()
+
+    def window_sum(cum, i, window):
+        return cum[i + 1] - cum[max(0, i - window + 1)]
+
+    # One spread per day, shared by the day's own columns and the next day's lags
+    spread_arr = compute_spread(prices, config['volatility'], rng)
+    spreads = spread_arr.tolist()
+    max_prices = np.round(np.asarray(prices) + spread_arr, 3).tolist()
+
+    # Supply series: auctions closed on Sundays (Indian markets vary, but
+    # cardamom auctions run mostly weekdays and some Saturdays)
+    is_open = dows != 6
+    raw_arrived = np.round(supply_base + supply_trend * np.arange(n)
+                           + rng.normal(0, supply_var, n), 1)
+    arrived = np.where(is_open, np.maximum(0, raw_arrived), 0.0)
+    sold = np.round(arrived * rng.uniform(0.78, 0.96, n), 1)
+    # Closed days (and arrivals clamped at zero) are written as a plain 0
+    qty_arrived = as_column(arrived, [(~is_open | (raw_arrived <= 0), 0)])
+    qty_sold = as_column(sold, [(~is_open, 0)])
+
+    # Auctioneer count (1-3 typical) on open days
+    auctioneer = np.where(is_open, rng.choice([1, 2, 2, 3], n), 0)
+    # Precip_Lag_60 and Soil_Moisture_Lag_14: estimate from current
+    precip_lag60 = np.round(weather['precip'] * rng.uniform(0.3, 1.5, n), 1)
+    soil_lag14 = np.round(weather['soil'] + rng.normal(0, 0.015, n), 3)
+
+    # Columns that are already whole vectors are filled directly
+    table['time'] = [dt.strftime('%d/%m/%Y') for dt in dates]
+    table['year'] = [dt.year for dt in dates]
+    table['month'] = [dt.month for dt in dates]
+    table['week_of_year'] = [week_of_year(dt) for dt in dates]
+    table['day_of_week'] = ((dows + 1) % 7).tolist()  # 0=Sun like JS
+    table['is_market_open'] = is_open.astype(int).tolist()
+    flood_days = config.get('flood_days')
+    table['is_flood_crisis'] = [flood_days(i) for i in range(n)] if callable(flood_days) else [0] * n
+    table['is_lockdown'] = [0] * n
+    table['Avg.Price (Rs./Kg)'] = prices
+    table['MaxPrice (Rs./Kg)'] = max_prices
+    table['Daily_Spread'] = spreads
+    table['Lag_MaxPrice_1'] = max_prices[:1] + max_prices[:-1]
+    table['Lag_Spread_1'] = spreads[:1] + spreads[:-1]
+    table['Total Qty Arrived (Kgs)'] = qty_arrived
+    table['Qty Sold (Kgs)'] = qty_sold
+    table['Lag_Qty_Sold_1'] = qty_sold[:1] + qty_sold[:-1]
+    table['Lag_Total_Qty_Arrived_1'] = qty_arrived[:1] + qty_arrived[:-1]
+    table['temperature_2m_mean (°C)'] = weather['temp_mean'].tolist()
+    table['temperature_2m_max (°C)'] = weather['temp_max'].tolist()
+    table['temperature_2m_min (°C)'] = weather['temp_min'].tolist()
+    table['Temp_Diff'] = weather['temp_diff'].tolist()
+    bounds = weather['bounds']
+    table['precipitation_sum (mm)'] = as_column(weather['precip'], bounds['precip'])
+    table['relative_humidity_2m_mean (%)'] = as_column(weather['humidity'], bounds['humidity'])
+    table['soil_moisture_0_to_7cm_mean (m³/m³)'] = weather['soil'].tolist()
+    table['et0_fao_evapotranspiration (mm)'] = as_column(weather['et0'], bounds['et0'])
+    table['Auctioneer'] = auctioneer.tolist()
+    table['Precip_Lag_60'] = precip_lag60.tolist()
+    table['Soil_Moisture_Lag_14'] = soil_lag14.tolist()
 
     for i in range(n):
-        dt = start_date + timedelta(days=i)
-        avg_price = prices[i]
-        w = weather_days[i]
-
-        spread = compute_spread(avg_price, config['volatility'])
-        max_price = r(avg_price + spread, 3)
-
-        # Market open: closed on Sundays roughly, but Indian markets vary
-        dow = dt.weekday()  # 0=Mon
-        # Cardamom auctions: mostly weekdays, some Saturdays
-        is_open = 0 if dow == 6 else 1  # closed Sunday
-        if dow == 6:
-            qty_arrived = 0
-            qty_sold = 0
-        else:
-            qty_arrived = max(0, r(supply_base + supply_trend * i + random.gauss(0, supply_var), 1))
-            sell_rate = random.uniform(0.78, 0.96)
-            qty_sold = r(qty_arrived * sell_rate, 1)
-
         # Smooth qty (rolling-like)
         smooth_qty = r(supply_base + supply_trend * i * 0.5, 4)
 
-        # Auctioneer count (1-3 typical)
-        auctioneer = random.choice([1, 2, 2, 3]) if is_open else 0
-
         # Lag features
-        lag1 = prices[i - 1] if i >= 1 else avg_price
+        lag1 = prices[i - 1] if i >= 1 else prices[0]
         lag7 = prices[i - 7] if i >= 7 else prices[0]
         lag14 = prices[i - 14] if i >= 14 else prices[0]
         lag30 = prices[0]  # only 30 rows, so lag30 = first price
 
-        lag_max_1 = r(prices[i - 1] + compute_spread(prices[i - 1], config['volatility']), 3) if i >= 1 else max_price
-        lag_spread_1 = r(compute_spread(prices[i - 1], config['volatility']), 3) if i >= 1 else spread
-
         # Moving averages
-        def ma(window):
-            start = max(0, i - window + 1)
-            subset = prices[start:i + 1]
-            return r(sum(subset) / len(subset), 6)
-
-        ma7 = ma(7)
-        ma14 = ma(14)
-        ma30 = ma(30)
-
-        # Lag qty features
-        if i >= 1:
-            prev_dt = start_date + timedelta(days=i - 1)
-            prev_dow = prev_dt.weekday()
-            if prev_dow == 6:
-                lag_qty_sold = 0
-                lag_qty_arrived = 0
-            else:
-                lag_qty_arrived = max(0, r(supply_base + supply_trend * (i - 1) + random.gauss(0, supply_var * 0.3), 1))
-                lag_qty_sold = r(lag_qty_arrived * random.uniform(0.80, 0.95), 1)
-        else:
-            lag_qty_sold = qty_sold
-            lag_qty_arrived = qty_arrived
+        ma7 = r(window_sum(cum_price, i, 7) / min(7, i + 1), 6)
+        ma14 = r(window_sum(cum_price, i, 14) / min(14, i + 1), 6)
+        ma30 = r(window_sum(cum_price, i, 30) / min(30, i + 1), 6)
 
         # Precipitation aggregates
-        precip_7d = r(sum(weather_days[max(0, i - 6):i + 1], []) if False else
-                      sum(wd['precip'] for wd in weather_days[max(0, i - 6):i + 1]), 1)
-        rh_7d = r(sum(wd['humidity'] for wd in weather_days[max(0, i - 6):i + 1]) /
-                  len(weather_days[max(0, i - 6):i + 1]), 1)
-        precip_30d = r(sum(wd['precip'] for wd in weather_days[:i + 1]), 1)
-
-        # Precip_Lag_60 and Soil_Moisture_Lag_14: estimate from current
-        precip_lag60 = r(w['precip'] * random.uniform(0.3, 1.5), 1)
-        soil_lag14 = r(w['soil'] + random.gauss(0, 0.015), 3)
-
-        row = {
-            'time': dt.strftime('%d/%m/%Y'),
-            'year': dt.year,
-            'month': dt.month,
-            'week_of_year': week_of_year(dt),
-            'day_of_week': dt.isoweekday() % 7,  # 0=Sun like JS
-            'is_market_open': is_open,
-            'is_flood_crisis': config.get('flood_days', lambda i: 0)(i) if callable(config.get('flood_days')) else 0,
-            'is_lockdown': 0,
-            'Avg.Price (Rs./Kg)': avg_price,
-            'MaxPrice (Rs./Kg)': max_price,
-            'Daily_Spread': r(spread, 3),
-            'Total Qty Arrived (Kgs)': qty_arrived,
-            'Qty Sold (Kgs)': qty_sold,
-            'Smooth_Qty_Arrived': smooth_qty,
-            'Auctioneer': auctioneer,
-            'temperature_2m_mean (°C)': w['temp_mean'],
-            'temperature_2m_max (°C)': w['temp_max'],
-            'temperature_2m_min (°C)': w['temp_min'],
-            'Temp_Diff': w['temp_diff'],
-            'precipitation_sum (mm)': w['precip'],
-            'relative_humidity_2m_mean (%)': w['humidity'],
-            'soil_moisture_0_to_7cm_mean (m³/m³)': w['soil'],
-            'et0_fao_evapotranspiration (mm)': w['et0'],
-            'Precip_7D': precip_7d,
-            'RH_7D': rh_7d,
-            'Lag1': lag1,
-            'Lag7': lag7,
-            'Lag14': lag14,
-            'Lag30': lag30,
-            'Lag_MaxPrice_1': lag_max_1,
-            'Lag_Spread_1': lag_spread_1,
-            'MA7': ma7,
-            'MA14': ma14,
-            'MA30': ma30,
-            'Lag_Qty_Sold_1': lag_qty_sold,
-            'Lag_Total_Qty_Arrived_1': lag_qty_arrived,
-            'Precip_30D_Sum': precip_30d,
-            'Precip_Lag_60': precip_lag60,
-            'Soil_Moisture_Lag_14': soil_lag14,
-        }
-        rows.append(row)
-
-    return rows
-
-
-def validate_scenario(rows, name):
+        precip_7d = r(window_sum(cum_precip, i, 7), 1) if window_sum(cum_rain_days, i, 7) else 0
+        rh_7d = r(window_sum(cum_hum, i, 7) / min(7, i + 1), 1)
+        precip_30d = r(cum_precip[i + 1], 1) if cum_rain_days[i + 1] else 0
+
+        table['Smooth_Qty_Arrived'].append(smooth_qty)
+        table['Precip_7D'].append(precip_7d)
+        table['RH_7D'].append(rh_7d)
+        table['Lag1'].append(lag1)
+        table['Lag7'].append(lag7)
+        table['Lag14'].append(lag14)
+        table['Lag30'].append(lag30)
+        table['MA7'].append(ma7)
+        table['MA14'].append(ma14)
+        table['MA30'].append(ma30)
+        table['Precip_30D_Sum'].append(precip_30d)
+
+    return table
+
+
+def validate_scenario(table, name):
     """Check internal consistency."""
-    errors = []
-    for i, row in enumerate(rows):
-        # Lag1 check
-        if i >= 1:
-            expected_lag1 = rows[i - 1]['Avg.Price (Rs./Kg)']
-            if abs(row['Lag1'] - expected_lag1) > 0.01:
-                errors.append(f"Row {i}: Lag1 mismatch ({row['Lag1']} vs {expected_lag1})")
-
-        # Spread check
-        expected_spread = row['MaxPrice (Rs./Kg)'] - row['Avg.Price (Rs./Kg)']
-        if abs(row['Daily_Spread'] - expected_spread) > 0.01:
-            errors.append(f"Row {i}: Spread mismatch")
-
-        # Price jump check
-        if i >= 1:
-            prev = rows[i - 1]['Avg.Price (Rs./Kg)']
-            pct = abs(row['Avg.Price (Rs./Kg)'] - prev) / prev
-            if pct > 0.06:
-                errors.append(f"Row {i}: Jump {pct*100:.1f}% exceeds 6%")
+    avg = np.asarray(table['Avg.Price (Rs./Kg)'])
+    lag1 = np.asarray(table['Lag1'])
+    max_price = np.asarray(table['MaxPrice (Rs./Kg)'])
+    spread = np.asarray(table['Daily_Spread'])
+
+    # Lag1 check, spread check and price jump check, all rows at once
+    lag1_err = np.abs(lag1[1:] - avg[:-1]) > 0.01
+    spread_err = np.abs(spread - (max_price - avg)) > 0.01
+    jump = np.abs(np.diff(avg)) / avg[:-1]
+    jump_err = jump > 0.06
+
+    # (row, check order, message), sorted to keep the per-row report order
+    errors = [(i + 1, 0, f"Row {i + 1}: Lag1 mismatch ({lag1[i + 1]} vs {avg[i]})")
+              for i in np.flatnonzero(lag1_err)]
+    errors += [(i, 1, f"Row {i}: Spread mismatch") for i in np.flatnonzero(spread_err)]
+    errors += [(i + 1, 2, f"Row {i + 1}: Jump {jump[i]*100:.1f}% exceeds 6%")
+               for i in np.flatnonzero(jump_err)]
+    errors = [msg for _, _, msg in sorted(errors)]
 
     if errors:
         print(f"  WARN [{name}]: {len(errors)} issues")
@@ -335,21 +390,31 @@ def validate_scenario(rows, name):
     return len(errors) == 0
 
 
-def write_csv(rows, filepath):
-    """Write rows to CSV with exact column order."""
+def write_csv(table, filepath):
+    """
+    Write a columnar table to CSV with exact column order.
+
+    Every value is a number or a DD/MM/YYYY date, so no field needs quoting
+    and the file is built as plain comma-joined lines in a single write.
+    """
+    columns = [table[col] for col in COLUMNS]
+    text = COLUMNS + [v for values in columns for v in values if isinstance(v, str)]
+    if any(ch in field for field in text for ch in ',"\r\n'):
+        raise ValueError(f"{filepath}: a field needs CSV quoting")
+
+    lines = [','.join(COLUMNS)]
+    lines += [','.join(map(str, row)) for row in zip(*columns)]
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     with open(filepath, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=COLUMNS)
-        writer.writeheader()
-        writer.writerows(rows)
-    print(f"  Saved: {filepath} ({len(rows)} rows)")
+        f.write('\r\n'.join(lines) + '\r\n')  # same line ending as csv.writer
+    print(f"  Saved: {filepath} ({len(lines) - 1} rows)")
 
 
-def summarize(rows, name):
+def summarize(table, name):
     """Print summary stats."""
-    prices = [r['Avg.Price (Rs./Kg)'] for r in rows]
-    first_date = rows[0]['time']
-    last_date = rows[-1]['time']
+    prices = table['Avg.Price (Rs./Kg)']
+    first_date = table['time'][0]
+    last_date = table['time'][-1]
     first_p = prices[0]
     last_p = prices[-1]
     change = (last_p - first_p) / first_p * 100
@@ -466,25 +531,44 @@ SCENARIOS = [
 ]
 
 
+# Below this many rows in total, pool start-up (tens of ms with fork, seconds
+# with spawn re-importing numpy) costs more than generating serially
+# at ~15 µs per row, so the six 30-row scenarios never use the pool.
+POOL_MIN_ROWS = 250_000
+
+
+def _run_one(index):
+    """Generate one scenario, seeded from its name."""
+    cfg = SCENARIOS[index]  # passed by index: configs hold lambdas, which don't pickle
+    seed = zlib.crc32(cfg['name'].encode('utf-8'))  # stable across runs, unlike hash()
+    return cfg['filename'], generate_scenario(cfg, np.random.default_rng(seed))
+
+
 def main():
-    random.seed(42)  # Reproducible
     out_dir = os.path.join(os.path.dirname(__file__), 'assets', 'data', 'test-scenarios')
     os.makedirs(out_dir, exist_ok=True)
 
     print("Generating 6 market scenario datasets...\n")
 
-    for cfg in SCENARIOS:
-        rows = generate_scenario(cfg)
-        filepath = os.path.join(out_dir, cfg['filename'])
-        summarize(rows, cfg['name'])
-        validate_scenario(rows, cfg['name'])
-        write_csv(rows, filepath)
+    # Scenarios are independent: large batches are generated in parallel,
+    # then reported and written serially so the log stays in scenario order
+    total_rows = sum(cfg.get('n_days', 30) for cfg in SCENARIOS)
+    processes = min(len(SCENARIOS), os.cpu_count() or 1)
+    if total_rows < POOL_MIN_ROWS or processes < 2:
+        results = list(map(_run_one, range(len(SCENARIOS))))
+    else:
+        with multiprocessing.Pool(processes=processes) as pool:
+            results = pool.map(_run_one, range(len(SCENARIOS)))
+
+    for cfg, (filename, table) in zip(SCENARIOS, results):
+        filepath = os.path.join(out_dir, filename)
+        summarize(table, cfg['name'])
+        validate_scenario(table, cfg['name'])
+        write_csv(table, filepath)
 
     # Also overwrite the main test file with Scenario 1
     main_test = os.path.join(os.path.dirname(__file__), 'assets', 'data', 'test-upload-feb-mar-2026.csv')
-    rows1 = generate_scenario(SCENARIOS[0])
-    random.seed(42)  # Reset for consistency
-    write_csv(rows1, main_test)
+    write_csv(results[0][1], main_test)
 
     print(f"\n{'='*60}")
     print(f"  All 6 files generated in: {out_dir}")
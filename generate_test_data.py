@@ -9,13 +9,13 @@ using realistic statistical patterns extracted from the historical dataset.
 """
 
 import csv
-import math
-import random
 import os
 from datetime import datetime, timedelta
 
+import numpy as np
+
 # ── Seed for reproducibility ─────────────────────────────
-random.seed(42)
+RNG = np.random.default_rng(42)
 
 # ── Constants from historical data analysis ──────────────
 # Last known values (Jan 9, 2026)
@@ -64,192 +64,204 @@ WEATHER_MAR = {
 }
 
 
-def rand_range(lo, hi):
-    return lo + random.random() * (hi - lo)
-
-
 def clamp(val, lo, hi):
     return max(lo, min(hi, val))
 
 
-def generate_data():
-    """Generate 30 days of synthetic cardamom market data."""
-    start_date = datetime(2026, 2, 8)
-    rows = []
-
-    # Build price history for lag calculations
-    price_history = list(RECENT_PRICES)
-    max_price_history = list(RECENT_MAX_PRICES)
-    qty_arrived_history = list(RECENT_QTY_ARRIVED)
-    qty_sold_history = list(RECENT_QTY_SOLD)
-    precip_history = [0] * 60  # last 60 days of precip
-
-    # Price simulation parameters
-    current_price = LAST_AVG_PRICE
-    trend = -0.0008  # slight downward trend (typical Feb correction)
-    volatility = 0.018  # ~1.8% daily volatility
-
-    for i in range(30):
-        date = start_date + timedelta(days=i)
-        month = date.month
-        day_of_week = date.weekday()  # 0=Mon, 6=Sun
-
-        # Market is open on weekdays (Mon-Fri)
-        is_market_open = 1 if day_of_week < 5 else 0
-
-        # Weather based on month
-        wx = WEATHER_FEB if month == 2 else WEATHER_MAR
+def _simulate_prices(start_price, trend, is_open, precip, noise, seasonal):
+    """
+    Sequential price path: trend + noise + seasonal + weather, with mean
+    reversion toward ~2450. Closed days carry the previous price forward.
+    """
+    n = len(is_open)
+    path = [0.0] * n
+    price = start_price
+    for i in range(n):
+        if is_open[i]:
+            weather_impact = (precip[i] / 500) * 0.003  # heavy rain → slight price up
+            daily_return = trend + noise[i] + seasonal[i] + weather_impact
 
-        temp_mean = round(rand_range(*wx['temp_mean']), 1)
-        temp_max = round(rand_range(*wx['temp_max']), 1)
-        temp_min = round(rand_range(*wx['temp_min']), 1)
-        temp_diff = round(temp_max - temp_min, 2)
-        precip = round(rand_range(*wx['precip']), 1)
-        humidity = round(rand_range(*wx['humidity']), 1)
-        soil_moisture = round(rand_range(*wx['soil']), 3)
-        et0 = round(rand_range(*wx['et0']), 1)
+            # Mean reversion toward ~2450
+            daily_return += (2450 - price) / 2450 * 0.02
 
-        precip_history.append(precip)
+            price = clamp(price * (1 + daily_return), 2200, 2800)
+        # else: weekend, price unchanged from Friday
+        path[i] = price
+    return path
 
-        # ── Price simulation ──────────────────────────────
-        if is_market_open:
-            # Add trend, noise, and seasonal
-            seasonal = math.sin(i / 14 * math.pi) * 0.004
-            weather_impact = (precip / 500) * 0.003  # heavy rain → slight price up
-            noise = (random.random() - 0.5) * 2 * volatility
-            daily_return = trend + noise + seasonal + weather_impact
 
-            # Mean reversion toward ~2450
-            mean_reversion = (2450 - current_price) / 2450 * 0.02
-            daily_return += mean_reversion
+def generate_data(rng=RNG):
+    """Generate 30 days of synthetic cardamom market data as a column table."""
+    n = 30
+    start_date = datetime(2026, 2, 8)
 
-            current_price = current_price * (1 + daily_return)
-            current_price = clamp(current_price, 2200, 2800)
-        # else: weekend, price unchanged from Friday
+    # Price simulation parameters
+    trend = -0.0008  # slight downward trend (typical Feb correction)
+    volatility = 0.018  # ~1.8% daily volatility
 
-        avg_price = round(current_price, 3) if is_market_open else round(current_price, 3)
-
-        # Max price: typically 15-40% above avg
-        spread_pct = rand_range(0.15, 0.40) if is_market_open else rand_range(0.15, 0.35)
-        max_price = round(avg_price * (1 + spread_pct), 0)
-        daily_spread = round(max_price - avg_price, 3)
-
-        # Quantity (0 on weekends/holidays)
-        if is_market_open:
-            base_qty = rand_range(80000, 200000)
-            qty_arrived = round(base_qty, 1)
-            sold_ratio = rand_range(0.92, 0.99)
-            qty_sold = round(qty_arrived * sold_ratio, 1)
-        else:
-            qty_arrived = 0
-            qty_sold = 0
-
-        # Smooth quantity (7-day rolling)
-        recent_qty = qty_arrived_history[-6:] + [qty_arrived]
-        smooth_qty = round(sum(recent_qty) / len(recent_qty), 4)
-
-        # Auctioneer (2 = typical)
-        auctioneer = 2 if is_market_open else 0
-
-        # ── Lag features ──────────────────────────────────
-        price_history.append(avg_price)
-        max_price_history.append(max_price)
-        qty_arrived_history.append(qty_arrived)
-        qty_sold_history.append(qty_sold)
-
-        lag1 = price_history[-2]
-        lag7 = price_history[-8] if len(price_history) >= 8 else price_history[0]
-        lag14 = price_history[-15] if len(price_history) >= 15 else price_history[0]
-        lag30 = price_history[-31] if len(price_history) >= 31 else price_history[0]
-
-        lag_max_1 = max_price_history[-2]
-        lag_spread_1 = round(max_price_history[-2] - price_history[-2], 3)
-
-        # Moving averages
-        ma7 = round(sum(price_history[-7:]) / min(7, len(price_history)), 6)
-        ma14 = round(sum(price_history[-14:]) / min(14, len(price_history)), 6)
-        ma30 = round(sum(price_history[-30:]) / min(30, len(price_history)), 6)
-
-        # Quantity lags
-        lag_qty_sold_1 = qty_sold_history[-2] if len(qty_sold_history) >= 2 else 0
-        lag_qty_arrived_1 = qty_arrived_history[-2] if len(qty_arrived_history) >= 2 else 0
-
-        # Precipitation features
-        precip_7d = round(sum(precip_history[-7:]), 1)
-        rh_7d = round(humidity, 1)  # simplified: use current day
-        precip_30d_sum = round(sum(precip_history[-30:]), 1)
-        precip_lag_60 = round(sum(precip_history[-60:-30]) if len(precip_history) >= 60 else 0, 1)
-        soil_moisture_lag_14 = round(soil_moisture + rand_range(-0.02, 0.02), 3)
-
-        # Week of year
-        week_of_year = date.isocalendar()[1]
-
-        # Format date as DD/MM/YYYY (matching historical data format)
-        date_str = date.strftime('%d/%m/%Y')
-
-        row = {
-            'time': date_str,
-            'year': date.year,
-            'month': month,
-            'week_of_year': week_of_year,
-            'day_of_week': day_of_week,
-            'is_market_open': is_market_open,
-            'is_flood_crisis': 0,
-            'is_lockdown': 0,
-            'Avg.Price (Rs./Kg)': avg_price,
-            'MaxPrice (Rs./Kg)': max_price,
-            'Daily_Spread': daily_spread,
-            'Total Qty Arrived (Kgs)': qty_arrived,
-            'Qty Sold (Kgs)': qty_sold,
-            'Smooth_Qty_Arrived': smooth_qty,
-            'Auctioneer': auctioneer,
-            'temperature_2m_mean (°C)': temp_mean,
-            'temperature_2m_max (°C)': temp_max,
-            'temperature_2m_min (°C)': temp_min,
-            'Temp_Diff': temp_diff,
-            'precipitation_sum (mm)': precip,
-            'relative_humidity_2m_mean (%)': humidity,
-            'soil_moisture_0_to_7cm_mean (m³/m³)': soil_moisture,
-            'et0_fao_evapotranspiration (mm)': et0,
-            'Precip_7D': precip_7d,
-            'RH_7D': rh_7d,
-            'Lag1': lag1,
-            'Lag7': lag7,
-            'Lag14': lag14,
-            'Lag30': lag30,
-            'Lag_MaxPrice_1': lag_max_1,
-            'Lag_Spread_1': lag_spread_1,
-            'MA7': ma7,
-            'MA14': ma14,
-            'MA30': ma30,
-            'Lag_Qty_Sold_1': lag_qty_sold_1,
-            'Lag_Total_Qty_Arrived_1': lag_qty_arrived_1,
-            'Precip_30D_Sum': precip_30d_sum,
-            'Precip_Lag_60': precip_lag_60,
-            'Soil_Moisture_Lag_14': soil_moisture_lag_14,
-        }
-        rows.append(row)
-
-    return rows
+    # Calendar fields, computed once for the whole period
+    dates = [start_date + timedelta(days=i) for i in range(n)]
+    months = [d.month for d in dates]
+    dows = np.array([d.weekday() for d in dates])  # 0=Mon, 6=Sun
+    weeks = [d.isocalendar()[1] for d in dates]
+    date_strs = [d.strftime('%d/%m/%Y') for d in dates]  # DD/MM/YYYY like historical data
+
+    # Market is open on weekdays (Mon-Fri)
+    is_open = dows < 5
+
+    # Weather based on month, drawn for all days at once
+    wx = [WEATHER_FEB if month == 2 else WEATHER_MAR for month in months]
+
+    def draw_weather(key):
+        lo, hi = np.array([w[key] for w in wx], dtype=float).T
+        return rng.uniform(lo, hi)
+
+    temp_mean = np.round(draw_weather('temp_mean'), 1)
+    temp_max = np.round(draw_weather('temp_max'), 1)
+    temp_min = np.round(draw_weather('temp_min'), 1)
+    temp_diff = np.round(temp_max - temp_min, 2)
+    precip = np.round(draw_weather('precip'), 1)
+    humidity = np.round(draw_weather('humidity'), 1)
+    soil_moisture = np.round(draw_weather('soil'), 3)
+    et0 = np.round(draw_weather('et0'), 1)
+
+    # ── Price simulation ──────────────────────────────
+    noise = (rng.random(n) - 0.5) * 2 * volatility
+    seasonal = np.sin(np.arange(n) / 14 * np.pi) * 0.004
+    path = _simulate_prices(LAST_AVG_PRICE, trend, is_open.tolist(), precip.tolist(),
+                            noise.tolist(), seasonal.tolist())
+    avg_price = np.round(path, 3)
+
+    # Max price: typically 15-40% above avg
+    spread_pct = np.where(is_open, rng.uniform(0.15, 0.40, n), rng.uniform(0.15, 0.35, n))
+    max_price = np.round(avg_price * (1 + spread_pct), 0)
+    daily_spread = np.round(max_price - avg_price, 3)
+
+    # Quantity (0 on weekends/holidays)
+    qty_arrived = np.where(is_open, np.round(rng.uniform(80000, 200000, n), 1), 0.0)
+    qty_sold = np.where(is_open, np.round(qty_arrived * rng.uniform(0.92, 0.99, n), 1), 0.0)
+
+    # Auctioneer (2 = typical)
+    auctioneer = np.where(is_open, 2, 0)
+
+    # ── Lag features ──────────────────────────────────
+    # Full series = recent known history followed by the simulated period;
+    # day i of the period sits at index len(history) + i.
+    price_history = np.concatenate((RECENT_PRICES, avg_price))
+    max_price_history = np.concatenate((RECENT_MAX_PRICES, max_price))
+    qty_arrived_history = np.concatenate((RECENT_QTY_ARRIVED, qty_arrived))
+    precip_history = np.concatenate((np.zeros(60), precip))  # last 60 days of precip
+
+    day = np.arange(n)
+    p_day = len(RECENT_PRICES) + day
+    m_day = len(RECENT_MAX_PRICES) + day
+    q_day = len(RECENT_QTY_ARRIVED) + day
+
+    def trailing_sum(history, end, window):
+        """Sum of the `window` values of `history` ending at index `end` (inclusive)."""
+        cum = np.concatenate(([0.0], np.cumsum(history)))
+        return cum[end + 1] - cum[end + 1 - window]
+
+    lag1 = price_history[p_day - 1]
+    lag7 = price_history[p_day - 7]
+    lag14 = price_history[p_day - 14]
+    lag30 = price_history[p_day - 30]
+
+    lag_spread_1 = np.round(max_price_history[m_day - 1] - lag1, 3)
+    # Taken from the lists so the known history keeps its ints (e.g. 2956)
+    lag_max_1 = RECENT_MAX_PRICES[-1:] + max_price.tolist()[:-1]
+
+    # Smooth quantity (7-day rolling)
+    smooth_qty = np.round(trailing_sum(qty_arrived_history, q_day, 7) / 7, 4)
+
+    # Moving averages
+    ma7 = np.round(trailing_sum(price_history, p_day, 7) / 7, 6)
+    ma14 = np.round(trailing_sum(price_history, p_day, 14) / 14, 6)
+    ma30 = np.round(trailing_sum(price_history, p_day, 30) / 30, 6)
+
+    # Closed days are written as a plain 0, as in the historical data
+    qty_arrived = np.where(is_open, qty_arrived.astype(object), 0).tolist()
+    qty_sold = np.where(is_open, qty_sold.astype(object), 0).tolist()
+
+    # Quantity lags
+    lag_qty_sold_1 = RECENT_QTY_SOLD[-1:] + qty_sold[:-1]
+    lag_qty_arrived_1 = RECENT_QTY_ARRIVED[-1:] + qty_arrived[:-1]
+
+    # Precipitation features
+    precip_day = 60 + day
+    precip_7d = np.round(trailing_sum(precip_history, precip_day, 7), 1)
+    rh_7d = humidity  # simplified: use current day
+    precip_30d_sum = np.round(trailing_sum(precip_history, precip_day, 30), 1)
+    precip_lag_60 = np.round(trailing_sum(precip_history, precip_day - 30, 30), 1)
+    # Windows that fall entirely in the zero padding sum to a plain 0
+    precip_lag_60 = np.where(precip_day - 30 < 60, 0, precip_lag_60.astype(object))
+    soil_moisture_lag_14 = np.round(soil_moisture + rng.uniform(-0.02, 0.02, n), 3)
+
+    columns = {
+        'time': date_strs,
+        'year': [d.year for d in dates],
+        'month': months,
+        'week_of_year': weeks,
+        'day_of_week': dows,
+        'is_market_open': is_open.astype(int),
+        'is_flood_crisis': [0] * n,
+        'is_lockdown': [0] * n,
+        'Avg.Price (Rs./Kg)': avg_price,
+        'MaxPrice (Rs./Kg)': max_price,
+        'Daily_Spread': daily_spread,
+        'Total Qty Arrived (Kgs)': qty_arrived,
+        'Qty Sold (Kgs)': qty_sold,
+        'Smooth_Qty_Arrived': smooth_qty,
+        'Auctioneer': auctioneer,
+        'temperature_2m_mean (°C)': temp_mean,
+        'temperature_2m_max (°C)': temp_max,
+        'temperature_2m_min (°C)': temp_min,
+        'Temp_Diff': temp_diff,
+        'precipitation_sum (mm)': precip,
+        'relative_humidity_2m_mean (%)': humidity,
+        'soil_moisture_0_to_7cm_mean (m³/m³)': soil_moisture,
+        'et0_fao_evapotranspiration (mm)': et0,
+        'Precip_7D': precip_7d,
+        'RH_7D': rh_7d,
+        'Lag1': lag1,
+        'Lag7': lag7,
+        'Lag14': lag14,
+        'Lag30': lag30,
+        'Lag_MaxPrice_1': lag_max_1,
+        'Lag_Spread_1': lag_spread_1,
+        'MA7': ma7,
+        'MA14': ma14,
+        'MA30': ma30,
+        'Lag_Qty_Sold_1': lag_qty_sold_1,
+        'Lag_Total_Qty_Arrived_1': lag_qty_arrived_1,
+        'Precip_30D_Sum': precip_30d_sum,
+        'Precip_Lag_60': precip_lag_60,
+        'Soil_Moisture_Lag_14': soil_moisture_lag_14,
+    }
+
+    # One list of plain Python values per column, in output order
+    return {k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in columns.items()}
 
 
 def main():
-    rows = generate_data()
+    columns = generate_data()
+    prices = columns['Avg.Price (Rs./Kg)']
+    n_rows = len(prices)
 
     # Determine output path
     script_dir = os.path.dirname(os.path.abspath(__file__))
     out_path = os.path.join(script_dir, 'assets', 'data', 'test-upload-feb-mar-2026.csv')
 
     # Write CSV
-    fieldnames = list(rows[0].keys())
+    fieldnames = list(columns)
     with open(out_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(zip(*columns.values()))
 
-    print(f'Generated {len(rows)} rows -> {out_path}')
-    print(f'Date range: {rows[0]["time"]} to {rows[-1]["time"]}')
-    print(f'Price range: {min(r["Avg.Price (Rs./Kg)"] for r in rows):.2f} - {max(r["Avg.Price (Rs./Kg)"] for r in rows):.2f} Rs/Kg')
+    print(f'Generated {n_rows} rows -> {out_path}')
+    print(f'Date range: {columns["time"][0]} to {columns["time"][-1]}')
+    print(f'Price range: {min(prices):.2f} - {max(prices):.2f} Rs/Kg')
     print(f'Features: {len(fieldnames)}')
 
 